@@ -18,18 +18,71 @@ import sys
 import os
 import json
 import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import List, Dict
+from urllib.parse import urlsplit
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-    QWidget, QPushButton, QTextEdit, QLabel, QProgressBar,
-    QMessageBox, QFileDialog, QGroupBox, QScrollArea,
-    QFrame, QSplitter
+    QWidget, QPushButton, QTextEdit, QPlainTextEdit, QLabel, QProgressBar,
+    QMessageBox, QFileDialog, QGroupBox, QListView,
+    QFrame, QSplitter, QStyledItemDelegate, QStyle, QStyleOptionButton, QAbstractItemView
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+    QObject, QRunnable, QThreadPool, pyqtSignal, Qt,
+    QAbstractListModel, QModelIndex, QSize, QRect
+)
+from PyQt6.QtGui import QFont, QFontMetrics, QColor, QPen
+
+
+# Application-wide stylesheet, applied once and keyed by objectName
+APP_QSS = """
+QLabel#fixRepoLabel { font-weight: bold; color: #8B0000; }
+QLabel#fixSuggestionLabel { color: #2E8B57; font-style: italic; }
+QLabel#noFixLabel { color: #FF6347; font-weight: bold; }
+QFrame#fixSeparator { color: #D3D3D3; }
+QPushButton#autoFixBtn { background-color: #32CD32; color: white; font-weight: bold; }
+QPushButton#forceFixBtn { background-color: #FF6347; color: white; font-weight: bold; }
+QPushButton#showCommandsBtn { background-color: #4682B4; color: white; }
+QPushButton#retryBtn { background-color: #FF8C00; color: white; font-weight: bold; }
+QPushButton#fixedBtn { background-color: #228B22; color: white; }
+QLabel#configLabel { color: gray; }
+QPushButton#pullBtn { background-color: #4CAF50; color: white; font-weight: bold; }
+QPushButton#pushBtn { background-color: #2196F3; color: white; font-weight: bold; }
+QGroupBox#successGroup::title { color: green; font-weight: bold; }
+QPlainTextEdit#successText { background-color: #f0f8f0; border: 1px solid #90EE90; }
+QPushButton#clearSuccessBtn { background-color: #90EE90; color: #006400; }
+QGroupBox#errorGroup::title { color: red; font-weight: bold; }
+QPlainTextEdit#errorText { background-color: #fff5f5; border: 1px solid #FFB6C1; color: #8B0000; }
+QLabel#fixAreaLabel { font-weight: bold; color: #8B0000; background-color: #FFF8DC; padding: 5px; border: 1px solid #DDD; }
+QListView#fixList { background-color: white; border: 1px solid #DDD; }
+QPushButton#clearErrorBtn { background-color: #FFB6C1; color: #8B0000; }
+QPushButton#healthCheckBtn { background-color: #20B2AA; color: white; }
+QPushButton#retryFailedBtn { background-color: #FF8C00; color: white; font-weight: bold; }
+"""
+
+# Directories never descended into while scanning for repositories
+SCAN_SKIP_DIRS = {'node_modules', '.venv', 'venv', '__pycache__'}
+
+# Seconds a cached health check result stays valid if .git/HEAD and .git/index are unchanged
+HEALTH_CACHE_TTL = 30.0
+
+# Worker threads for git tasks: about 3/4 of the CPUs, since the work is
+# dominated by git process startup and network waits
+GIT_POOL_THREADS = max(2, 3 * (os.cpu_count() or 1) // 4)
+
+# Directory for the SSH control sockets used by network git commands: repositories
+# on the same host are run back to back and share one multiplexed connection
+SSH_CONTROL_DIR = Path.home() / '.ssh'
+SSH_MULTIPLEX_COMMAND = (
+    f'ssh -o ControlMaster=auto -o ControlPath="{SSH_CONTROL_DIR}/cm_%C" -o ControlPersist=60'
+)
+
+# Tasks per remote host; later connections multiplex over the first one's master
+HOST_TASKS = 4
 
 
 class GitDiagnostics:
@@ -125,7 +178,14 @@ class GitDiagnostics:
                 'commands': []
             }
         
-        return error_info
+        return GitDiagnostics.with_command_text(error_info)
+    
+    @staticmethod
+    def with_command_text(analysis: Dict) -> Dict:
+        """Precompute the display strings for an analysis' fix commands"""
+        analysis['commands_text'] = "\n".join(analysis['commands'])
+        analysis['commands_bullets'] = "\n".join(f"• {cmd}" for cmd in analysis['commands'])
+        return analysis
     
     @staticmethod
     def check_repository_health(repo_path: Path) -> Dict:
@@ -144,9 +204,10 @@ class GitDiagnostics:
                 health_info['issues'].append('Not a git repository')
                 return health_info
             
-            # Check current branch
+            # Check current branch and uncommitted changes with a single git process
+            # The "## ..." header line reports the branch, the remaining lines the changes
             result = subprocess.run(
-                ['git', 'branch', '--show-current'],
+                ['git', 'status', '--porcelain', '--branch'],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
@@ -154,40 +215,123 @@ class GitDiagnostics:
             )
             
             if result.returncode == 0:
-                current_branch = result.stdout.strip()
-                if not current_branch:
+                status_lines = result.stdout.strip().split('\n')
+                if status_lines[0].startswith('## HEAD (no branch)'):
                     health_info['warnings'].append('Repository is in detached HEAD state')
+                if len(status_lines) > 1:
+                    health_info['warnings'].append('Repository has uncommitted changes')
             
-            # Check for uncommitted changes
+            # Check remote tracking
+            if not GitDiagnostics.has_remote(repo_path):
+                health_info['issues'].append('No remote repository configured')
+                health_info['healthy'] = False
+            
+        except Exception as e:
+            health_info['healthy'] = False
+            health_info['issues'].append(f'Health check failed: {str(e)}')
+        
+        return health_info
+    
+    @staticmethod
+    def has_remote(repo_path: Path) -> bool:
+        """Check whether any remote is configured, reading .git/config when possible"""
+        config_file = repo_path / '.git' / 'config'
+        if config_file.is_file():
+            with open(config_file, 'r', encoding='utf-8', errors='replace') as f:
+                return any(line.strip().startswith('[remote ') for line in f)
+        
+        # .git is a file (worktree/submodule) - let git resolve the config
+        result = subprocess.run(
+            ['git', 'remote'],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.returncode == 0 and bool(result.stdout.strip())
+    
+    @staticmethod
+    def remote_config(repo_path: Path) -> tuple:
+        """Return (origin host, core.sshCommand) for a repository, '' where unset.
+        
+        The ssh command is the repository's own setting; see user_ssh_command().
+        """
+        url = ssh_command = ''
+        config_file = repo_path / '.git' / 'config'
+        if config_file.is_file():
+            section = ''
+            with open(config_file, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith('['):
+                        section = line
+                    elif '=' in line:
+                        key, value = (part.strip() for part in line.split('=', 1))
+                        if section == '[remote "origin"]' and key == 'url' and not url:
+                            url = value
+                        elif section.lower() == '[core]' and key.lower() == 'sshcommand':
+                            ssh_command = value
+        else:
+            # .git is a file (worktree/submodule) - let git resolve the config
             result = subprocess.run(
-                ['git', 'status', '--porcelain'],
+                ['git', 'config', '--get-regexp', r'^(remote\.origin\.url|core\.sshcommand)$'],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                health_info['warnings'].append('Repository has uncommitted changes')
-            
-            # Check remote tracking
+            for line in result.stdout.splitlines():
+                key, _, value = line.partition(' ')
+                if key == 'remote.origin.url':
+                    url = url or value
+                else:
+                    ssh_command = value
+        
+        if '://' in url:
+            host = urlsplit(url).hostname or ''
+        else:
+            # scp-like syntax: [user@]host:path (a single letter is a Windows drive)
+            host = url.split(':', 1)[0].rpartition('@')[2] if ':' in url else ''
+            host = host if len(host) > 1 and '/' not in host else ''
+        return host, ssh_command
+    
+    @staticmethod
+    def user_ssh_command() -> str:
+        """Return core.sshCommand from the global/system git config, or ''"""
+        try:
             result = subprocess.run(
-                ['git', 'remote', '-v'],
-                cwd=repo_path,
+                ['git', 'config', '--show-scope', '--get-all', 'core.sshCommand'],
+                cwd=Path.home(),
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            
-            if result.returncode != 0 or not result.stdout.strip():
-                health_info['issues'].append('No remote repository configured')
-                health_info['healthy'] = False
-            
-        except Exception as e:
-            health_info['healthy'] = False
-            health_info['issues'].append(f'Health check failed: {str(e)}')
-        
-        return health_info
+        except (OSError, subprocess.SubprocessError):
+            return ''
+        for line in result.stdout.splitlines():
+            scope, _, value = line.partition('\t')
+            if scope in ('global', 'system'):
+                return value
+        return ''
+    
+    @staticmethod
+    def network_env():
+        """Return the environment for push/pull with SSH multiplexing, or None to inherit ours.
+        
+        Multiplexing is left out when the user already chose an ssh command
+        (GIT_SSH, GIT_SSH_COMMAND or a global core.sshCommand) so their identities
+        still apply; repositories with their own core.sshCommand must not use it either.
+        """
+        if os.name == 'nt' or 'GIT_SSH' in os.environ or 'GIT_SSH_COMMAND' in os.environ:
+            return None
+        if GitDiagnostics.user_ssh_command():
+            return None
+        try:
+            # ssh fails outright if the ControlPath directory is missing
+            SSH_CONTROL_DIR.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            return None
+        return {**os.environ, 'GIT_SSH_COMMAND': SSH_MULTIPLEX_COMMAND}
     
     @staticmethod
     def check_uncommitted_changes(repo_path: Path) -> Dict:
@@ -369,32 +513,105 @@ class GitDiagnostics:
         return fix_result
 
 
-class GitWorker(QThread):
+class BatchSignals(QObject):
+    """
+    Completion tracking shared by all thread pool tasks of one batch
+    QRunnable is not a QObject, so tasks report through this instance
+    """
+    finished = pyqtSignal()                       # Signal when all tasks complete
+
+    def __init__(self, total: int):
+        super().__init__()
+        self.total = total
+        self._completed = 0
+        self._lock = threading.Lock()
+    
+    def task_done(self):
+        """Count a finished task and emit finished once the whole batch is done"""
+        with self._lock:
+            self._completed += 1
+            all_done = self._completed == self.total
+        
+        if all_done:
+            self.finished.emit()
+
+
+class GitSignals(BatchSignals):
     """
-    Worker thread for executing git operations
-    Prevents GUI freezing during long operations
+    Signals shared by all GitRepoRunnable tasks of one batch
     """
     progress = pyqtSignal(str)                    # Signal for progress updates
     success_output = pyqtSignal(str)              # Signal for successful operations
     error_output = pyqtSignal(str, dict)          # Signal for error messages with fix info
-    finished = pyqtSignal()                       # Signal when all operations complete
 
-    def __init__(self, repositories: List[Path], operation: str):
+
+class HealthCheckSignals(BatchSignals):
+    """
+    Signals shared by all HealthCheckTask tasks of one batch
+    """
+    result = pyqtSignal(object, str, bool)        # Signal with (repo_path, summary_line, is_issue)
+
+
+class HealthCheckTask(QRunnable):
+    """
+    Thread pool task running the pre-flight health check of one repository
+    Each task only touches its own repository, so checks can run in parallel
+    """
+
+    def __init__(self, repo_path: Path, repo_display: str, signals: HealthCheckSignals):
+        super().__init__()
+        self.repo_path = repo_path
+        self.repo_display = repo_display
+        self.signals = signals
+    
+    def run(self):
+        """Check the repository and report a formatted summary line"""
+        try:
+            health_info = GitDiagnostics.check_repository_health(self.repo_path)
+            
+            # Format the report line here so the GUI thread only concatenates
+            is_issue = not health_info['healthy']
+            if is_issue:
+                summary_line = f"❌ {self.repo_display}: {', '.join(health_info['issues'])}"
+            elif health_info['warnings']:
+                summary_line = f"⚠️ {self.repo_display}: {', '.join(health_info['warnings'])}"
+            else:
+                summary_line = f"✅ {self.repo_display}: Healthy"
+            
+            self.signals.result.emit(self.repo_path, summary_line, is_issue)
+        finally:
+            self.signals.task_done()
+
+
+class GitRepoRunnable(QRunnable):
+    """
+    Thread pool task executing a git operation on repositories sharing a remote host
+    Hosts run in parallel; repositories of one host run in turn so they can
+    reuse its SSH connection
+    """
+
+    def __init__(self, repositories: List[tuple], operation: str, signals: GitSignals):
         super().__init__()
+        # (1-based position, repo_path, repo_display, env for push/pull or None) tuples
         self.repositories = repositories
         self.operation = operation  # 'pull' or 'push'
+        self.signals = signals
+        self.position = 1  # Position of the repository being processed
+        self.total = signals.total
     
-    def execute_git_command(self, cmd: List[str], repo_path: Path, timeout: int = 30) -> subprocess.CompletedProcess:
-        """Execute a git command and return the result"""
+    def execute_git_command(self, cmd: List[str], repo_path: Path, timeout: int = 30,
+                            env: Dict = None) -> subprocess.CompletedProcess:
+        """Execute a git command and return the result (env None inherits ours)"""
         return subprocess.run(
             cmd,
             cwd=repo_path,
             capture_output=True,
             text=True,
-            timeout=timeout
+            timeout=timeout,
+            env=env
         )
     
-    def perform_push_operation(self, repo_path: Path, repo_display: str) -> str:
+    def perform_push_operation(self, repo_path: Path, repo_display: str, network_env: Dict = None) -> str:
         """Perform push operation with automatic add and commit"""
         operations = []
         
@@ -460,7 +677,7 @@ class GitWorker(QThread):
             
             # Push changes
             operations.append("  → Running: git push")
-            result = self.execute_git_command(['git', 'push'], repo_path)
+            result = self.execute_git_command(['git', 'push'], repo_path, env=network_env)
             
             # Debug: Show push result
             operations.append(f"  → Push return code: {result.returncode}")
@@ -495,7 +712,7 @@ class GitWorker(QThread):
                 error_msg += "\n" + "\n".join(operations)
             return error_msg
     
-    def perform_pull_operation(self, repo_path: Path, repo_display: str) -> str:
+    def perform_pull_operation(self, repo_path: Path, repo_display: str, network_env: Dict = None) -> str:
         """Perform pull operation with uncommitted changes check"""
         try:
             # Check for uncommitted changes first
@@ -514,7 +731,7 @@ class GitWorker(QThread):
                 return skip_msg
             
             # Proceed with pull since working directory is clean
-            result = self.execute_git_command(['git', 'pull'], repo_path)
+            result = self.execute_git_command(['git', 'pull'], repo_path, env=network_env)
             
             if result.returncode == 0:
                 success_msg = f"✓ {repo_display}: pull successful"
@@ -535,118 +752,103 @@ class GitWorker(QThread):
             return f"✗ {repo_display}: Pull operation failed - {str(e)}"
     
     def run(self):
-        """Execute git operations on all repositories"""
-        total_repos = len(self.repositories)
-        
-        for i, repo_path in enumerate(self.repositories, 1):
+        """Execute the git operation on this task's repositories"""
+        for position, repo_path, repo_display, network_env in self.repositories:
+            self.position = position
             try:
-                # Show progress with repository path relative info
-                progress_msg = f"[{i}/{total_repos}] Processing: {repo_path.name}"
-                # If repo is deeply nested, show parent context
-                if len(repo_path.parts) > 2:
-                    parent_context = "/".join(repo_path.parts[-2:])
-                    progress_msg = f"[{i}/{total_repos}] Processing: {parent_context}"
-                
-                self.progress.emit(progress_msg)
-                
-                # Format repository name for results (show relative path if nested)
-                repo_display = str(repo_path.name)
-                if len(repo_path.parts) > 2:
-                    repo_display = "/".join(repo_path.parts[-2:])
-                
-                # Perform health check before operation
-                health_info = GitDiagnostics.check_repository_health(repo_path)
-                
-                if not health_info['healthy']:
-                    error_msg = f"✗ {repo_display}: Repository health check failed"
-                    error_msg += f"\n  Issues: {', '.join(health_info['issues'])}"
-                    
-                    error_info = {
-                        'repo_path': repo_path,
-                        'repo_display': repo_display,
-                        'analysis': {
-                            'type': 'health_check_failed',
-                            'description': f'Repository health issues: {", ".join(health_info["issues"])}',
-                            'fix_available': False,
-                            'fix_description': 'Fix repository issues manually',
-                            'commands': []
-                        },
-                        'health': health_info
-                    }
-                    self.error_output.emit(error_msg, error_info)
-                    continue
-                
-                # Execute operation based on type
-                if self.operation == 'pull':
-                    result_msg = self.perform_pull_operation(repo_path, repo_display)
-                elif self.operation == 'push':
-                    result_msg = self.perform_push_operation(repo_path, repo_display)
-                else:
-                    raise ValueError(f"Unknown operation: {self.operation}")
-                
-                # Determine if it's success, warning, or error
-                if result_msg.startswith('✓'):
-                    # Add health warnings if any
-                    if health_info['warnings']:
-                        result_msg += f"\n  ⚠ Warnings: {', '.join(health_info['warnings'])}"
-                    self.success_output.emit(result_msg)
-                elif result_msg.startswith('⚠'):
-                    # This is a warning (like skipped pull), treat as success but with warning
-                    self.success_output.emit(result_msg)
-                else:
-                    # This is an error, analyze it
-                    error_text = result_msg
-                    error_analysis = GitDiagnostics.analyze_error(error_text, repo_path)
-                    
-                    error_info = {
-                        'repo_path': repo_path,
-                        'repo_display': repo_display,
-                        'analysis': error_analysis,
-                        'health': health_info
-                    }
-                    
-                    self.error_output.emit(error_text, error_info)
-                        
-            except subprocess.TimeoutExpired:
-                repo_display = str(repo_path.name)
-                if len(repo_path.parts) > 2:
-                    repo_display = "/".join(repo_path.parts[-2:])
+                self.process_repository(repo_path, repo_display, network_env)
+            finally:
+                # Always count the repository so the batch can finish
+                self.signals.task_done()
+    
+    def process_repository(self, repo_path: Path, repo_display: str, network_env: Dict = None):
+        """Run health check and git operation for one repository, emitting results"""
+        try:
+            # Show progress with repository path relative info
+            self.signals.progress.emit(f"[{self.position}/{self.total}] Processing: {repo_display}")
+            
+            # Perform health check before operation
+            health_info = GitDiagnostics.check_repository_health(repo_path)
+            
+            if not health_info['healthy']:
+                error_msg = f"✗ {repo_display}: Repository health check failed"
+                error_msg += f"\n  Issues: {', '.join(health_info['issues'])}"
                 
                 error_info = {
                     'repo_path': repo_path,
                     'repo_display': repo_display,
-                    'analysis': {
-                        'type': 'timeout',
-                        'description': 'Operation timed out after 30 seconds',
+                    'analysis': GitDiagnostics.with_command_text({
+                        'type': 'health_check_failed',
+                        'description': f'Repository health issues: {", ".join(health_info["issues"])}',
                         'fix_available': False,
-                        'fix_description': 'Try again or check repository status manually',
+                        'fix_description': 'Fix repository issues manually',
                         'commands': []
-                    },
-                    'health': {}
+                    }),
+                    'health': health_info
                 }
-                self.error_output.emit(f"✗ {repo_display}: Operation timed out", error_info)
-                
-            except Exception as e:
-                repo_display = str(repo_path.name)
-                if len(repo_path.parts) > 2:
-                    repo_display = "/".join(repo_path.parts[-2:])
+                self.signals.error_output.emit(error_msg, error_info)
+                return
+            
+            # Execute operation based on type
+            if self.operation == 'pull':
+                result_msg = self.perform_pull_operation(repo_path, repo_display, network_env)
+            elif self.operation == 'push':
+                result_msg = self.perform_push_operation(repo_path, repo_display, network_env)
+            else:
+                raise ValueError(f"Unknown operation: {self.operation}")
+            
+            # Determine if it's success, warning, or error
+            if result_msg.startswith('✓'):
+                # Add health warnings if any
+                if health_info['warnings']:
+                    result_msg += f"\n  ⚠ Warnings: {', '.join(health_info['warnings'])}"
+                self.signals.success_output.emit(result_msg)
+            elif result_msg.startswith('⚠'):
+                # This is a warning (like skipped pull), treat as success but with warning
+                self.signals.success_output.emit(result_msg)
+            else:
+                # This is an error, analyze it
+                error_text = result_msg
+                error_analysis = GitDiagnostics.analyze_error(error_text, repo_path)
                 
                 error_info = {
                     'repo_path': repo_path,
                     'repo_display': repo_display,
-                    'analysis': {
-                        'type': 'exception',
-                        'description': f'Unexpected error: {str(e)}',
-                        'fix_available': False,
-                        'fix_description': 'Check repository manually',
-                        'commands': []
-                    },
-                    'health': {}
+                    'analysis': error_analysis,
+                    'health': health_info
                 }
-                self.error_output.emit(f"✗ {repo_display}: {str(e)}", error_info)
-        
-        # Emit completion signal
-        self.finished.emit()
+                
+                self.signals.error_output.emit(error_text, error_info)
+                    
+        except subprocess.TimeoutExpired:
+            error_info = {
+                'repo_path': repo_path,
+                'repo_display': repo_display,
+                'analysis': GitDiagnostics.with_command_text({
+                    'type': 'timeout',
+                    'description': 'Operation timed out after 30 seconds',
+                    'fix_available': False,
+                    'fix_description': 'Try again or check repository status manually',
+                    'commands': []
+                }),
+                'health': {}
+            }
+            self.signals.error_output.emit(f"✗ {repo_display}: Operation timed out", error_info)
+            
+        except Exception as e:
+            error_info = {
+                'repo_path': repo_path,
+                'repo_display': repo_display,
+                'analysis': GitDiagnostics.with_command_text({
+                    'type': 'exception',
+                    'description': f'Unexpected error: {str(e)}',
+                    'fix_available': False,
+                    'fix_description': 'Check repository manually',
+                    'commands': []
+                }),
+                'health': {}
+            }
+            self.signals.error_output.emit(f"✗ {repo_display}: {str(e)}", error_info)
 
 
 class ErrorFixWidget(QWidget):
@@ -655,19 +857,37 @@ class ErrorFixWidget(QWidget):
     """
     
     retry_requested = pyqtSignal(str)  # Signal for retry request
+    fix_applied = pyqtSignal()  # A fix succeeded; applied_fixes should be stored in the model
+    
+    # Layout metrics, also used by ErrorDelegate to size rows without building widgets
+    CONTENTS_MARGINS = (10, 5, 10, 5)
+    SPACING = 6
+    SEPARATOR_HEIGHT = 3
     
     def __init__(self, error_info: Dict, parent=None):
         super().__init__(parent)
         self.error_info = error_info
+        # Fixes already applied to this row ('auto', 'force'), kept by the model
+        # because the editor is re-created whenever the row becomes current
+        self.applied_fixes = set(error_info.get('fixed', ()))
+        # Used as a list view editor, so paint over the delegate-drawn row
+        self.setAutoFillBackground(True)
+        
+        # Reusable dialogs, created on first use (editors are built per row
+        # activation, most without any click) and reconfigured afterwards
+        self._confirm_box = None
+        self._message_box = None
+        
         self.init_ui()
     
     def init_ui(self):
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 5, 10, 5)
+        layout.setContentsMargins(*self.CONTENTS_MARGINS)
+        layout.setSpacing(self.SPACING)
         
         # Repository name
         repo_label = QLabel(f"Repository: {self.error_info['repo_display']}")
-        repo_label.setStyleSheet("font-weight: bold; color: #8B0000;")
+        repo_label.setObjectName("fixRepoLabel")
         layout.addWidget(repo_label)
         
         # Error analysis
@@ -681,33 +901,37 @@ class ErrorFixWidget(QWidget):
             # Fix information
             if analysis['fix_available']:
                 fix_label = QLabel(f"💡 Suggested Fix: {analysis['fix_description']}")
-                fix_label.setStyleSheet("color: #2E8B57; font-style: italic;")
+                fix_label.setObjectName("fixSuggestionLabel")
                 fix_label.setWordWrap(True)
                 layout.addWidget(fix_label)
                 
                 # Auto-fix buttons
                 button_layout = QHBoxLayout()
                 
-                auto_fix_btn = QPushButton("🔧 Auto-Fix")
-                auto_fix_btn.setStyleSheet("background-color: #32CD32; color: white; font-weight: bold;")
-                auto_fix_btn.clicked.connect(self.perform_auto_fix)
-                button_layout.addWidget(auto_fix_btn)
+                self.auto_fix_btn = QPushButton("🔧 Auto-Fix")
+                self.auto_fix_btn.setObjectName("autoFixBtn")
+                self.auto_fix_btn.clicked.connect(self.perform_auto_fix)
+                if 'auto' in self.applied_fixes:
+                    self.mark_fixed(self.auto_fix_btn, "✅ Fixed")
+                button_layout.addWidget(self.auto_fix_btn)
                 
                 # Special handling for non-fast-forward errors
                 if analysis['type'] == 'non_fast_forward':
-                    force_fix_btn = QPushButton("⚡ Force Fix")
-                    force_fix_btn.setStyleSheet("background-color: #FF6347; color: white; font-weight: bold;")
-                    force_fix_btn.clicked.connect(self.perform_force_fix)
-                    button_layout.addWidget(force_fix_btn)
+                    self.force_fix_btn = QPushButton("⚡ Force Fix")
+                    self.force_fix_btn.setObjectName("forceFixBtn")
+                    self.force_fix_btn.clicked.connect(self.perform_force_fix)
+                    if 'force' in self.applied_fixes:
+                        self.mark_fixed(self.force_fix_btn, "✅ Force Fixed")
+                    button_layout.addWidget(self.force_fix_btn)
                 
                 manual_btn = QPushButton("📋 Show Commands")
-                manual_btn.setStyleSheet("background-color: #4682B4; color: white;")
+                manual_btn.setObjectName("showCommandsBtn")
                 manual_btn.clicked.connect(self.show_manual_commands)
                 button_layout.addWidget(manual_btn)
                 
                 # Add retry button
                 retry_btn = QPushButton("🔄 Retry Operation")
-                retry_btn.setStyleSheet("background-color: #FF8C00; color: white; font-weight: bold;")
+                retry_btn.setObjectName("retryBtn")
                 retry_btn.clicked.connect(self.retry_operation)
                 button_layout.addWidget(retry_btn)
                 
@@ -715,13 +939,13 @@ class ErrorFixWidget(QWidget):
                 layout.addLayout(button_layout)
             else:
                 no_fix_label = QLabel("⚠️ Manual intervention required")
-                no_fix_label.setStyleSheet("color: #FF6347; font-weight: bold;")
+                no_fix_label.setObjectName("noFixLabel")
                 layout.addWidget(no_fix_label)
                 
                 # Still add retry button for manual fixes
                 button_layout = QHBoxLayout()
                 retry_btn = QPushButton("🔄 Retry After Manual Fix")
-                retry_btn.setStyleSheet("background-color: #FF8C00; color: white; font-weight: bold;")
+                retry_btn.setObjectName("retryBtn")
                 retry_btn.clicked.connect(self.retry_operation)
                 button_layout.addWidget(retry_btn)
                 button_layout.addStretch()
@@ -730,9 +954,43 @@ class ErrorFixWidget(QWidget):
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("color: #D3D3D3;")
+        separator.setObjectName("fixSeparator")
+        separator.setFixedHeight(self.SEPARATOR_HEIGHT)
         layout.addWidget(separator)
     
+    def mark_fixed(self, button: QPushButton, text: str):
+        """Show a fix button as done and disable it"""
+        button.setText(text)
+        button.setEnabled(False)
+        button.setObjectName("fixedBtn")
+        # Re-apply the stylesheet for the new objectName
+        button.style().unpolish(button)
+        button.style().polish(button)
+    
+    def ask_confirmation(self, icon: QMessageBox.Icon, title: str, text: str,
+                         default_button=QMessageBox.StandardButton.Yes) -> bool:
+        """Show the cached Yes/No dialog and return True if Yes was chosen"""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        self._confirm_box.setIcon(icon)
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        self._confirm_box.setDefaultButton(default_button)
+        self._confirm_box.exec()
+        clicked = self._confirm_box.standardButton(self._confirm_box.clickedButton())
+        return clicked == QMessageBox.StandardButton.Yes
+    
+    def show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show the cached informational dialog"""
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+            self._message_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._message_box.setIcon(icon)
+        self._message_box.setWindowTitle(title)
+        self._message_box.setText(text)
+        self._message_box.exec()
+    
     def retry_operation(self):
         """Request retry of the operation for this repository"""
         repo_path = str(self.error_info['repo_path'])
@@ -744,8 +1002,8 @@ class ErrorFixWidget(QWidget):
         repo_path = self.error_info['repo_path']
         
         # Show warning dialog
-        reply = QMessageBox.warning(
-            self, 
+        confirmed = self.ask_confirmation(
+            QMessageBox.Icon.Warning,
             "Force Fix Warning",
             f"This will perform an aggressive fix for the non-fast-forward error:\n\n"
             f"1. Fetch latest changes from remote\n"
@@ -753,11 +1011,10 @@ class ErrorFixWidget(QWidget):
             f"3. Force push if needed\n\n"
             f"⚠️ WARNING: This may lose local commits!\n\n"
             f"Are you sure you want to continue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
+        if confirmed:
             try:
                 # Get current branch name first
                 branch_result = subprocess.run(
@@ -769,12 +1026,12 @@ class ErrorFixWidget(QWidget):
                 )
                 
                 if branch_result.returncode != 0:
-                    QMessageBox.critical(self, "Error", "Could not determine current branch")
+                    self.show_message(QMessageBox.Icon.Critical, "Error", "Could not determine current branch")
                     return
                 
                 current_branch = branch_result.stdout.strip()
                 if not current_branch:
-                    QMessageBox.critical(self, "Error", "Repository appears to be in detached HEAD state")
+                    self.show_message(QMessageBox.Icon.Critical, "Error", "Repository appears to be in detached HEAD state")
                     return
                 
                 # Execute force fix commands
@@ -789,29 +1046,30 @@ class ErrorFixWidget(QWidget):
                     force_commands
                 )
                 
+                out_preview = "\n".join(fix_result['output'][:10])
+                
                 if fix_result['success']:
-                    QMessageBox.information(
-                        self,
+                    self.show_message(
+                        QMessageBox.Icon.Information,
                         "Force Fix Successful",
-                        f"✅ {fix_result['message']}\n\nOutput:\n" + "\n".join(fix_result['output'][:10])
+                        f"✅ {fix_result['message']}\n\nOutput:\n{out_preview}"
                     )
-                    # Update button to show success
-                    sender = self.sender()
-                    sender.setText("✅ Force Fixed")
-                    sender.setEnabled(False)
-                    sender.setStyleSheet("background-color: #228B22; color: white;")
+                    # Update button to show success and remember it in the model
+                    self.applied_fixes.add('force')
+                    self.mark_fixed(self.force_fix_btn, "✅ Force Fixed")
+                    self.fix_applied.emit()
                     
                     # Auto-retry the operation
                     self.retry_operation()
                 else:
-                    QMessageBox.warning(
-                        self,
+                    self.show_message(
+                        QMessageBox.Icon.Warning,
                         "Force Fix Failed",
-                        f"❌ {fix_result['message']}\n\nOutput:\n" + "\n".join(fix_result['output'][:10])
+                        f"❌ {fix_result['message']}\n\nOutput:\n{out_preview}"
                     )
             except Exception as e:
-                QMessageBox.critical(
-                    self,
+                self.show_message(
+                    QMessageBox.Icon.Critical,
                     "Force Fix Error",
                     f"Error during force fix: {str(e)}"
                 )
@@ -822,15 +1080,14 @@ class ErrorFixWidget(QWidget):
         repo_path = self.error_info['repo_path']
         
         # Show confirmation dialog
-        reply = QMessageBox.question(
-            self, 
+        confirmed = self.ask_confirmation(
+            QMessageBox.Icon.Question,
             "Confirm Auto-Fix",
             f"Attempt to automatically fix '{analysis['type']}' in repository?\n\n"
-            f"Commands to be executed:\n" + "\n".join(f"• {cmd}" for cmd in analysis['commands']),
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            f"Commands to be executed:\n{analysis['commands_bullets']}"
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
+        if confirmed:
             try:
                 # Perform the auto-fix
                 fix_result = GitDiagnostics.auto_fix_repository(
@@ -839,29 +1096,30 @@ class ErrorFixWidget(QWidget):
                     analysis['commands']
                 )
                 
+                out_preview = "\n".join(fix_result['output'][:10])
+                
                 if fix_result['success']:
-                    QMessageBox.information(
-                        self,
+                    self.show_message(
+                        QMessageBox.Icon.Information,
                         "Auto-Fix Successful",
-                        f"✅ {fix_result['message']}\n\nOutput:\n" + "\n".join(fix_result['output'][:10])
+                        f"✅ {fix_result['message']}\n\nOutput:\n{out_preview}"
                     )
-                    # Update button to show success
-                    sender = self.sender()
-                    sender.setText("✅ Fixed")
-                    sender.setEnabled(False)
-                    sender.setStyleSheet("background-color: #228B22; color: white;")
+                    # Update button to show success and remember it in the model
+                    self.applied_fixes.add('auto')
+                    self.mark_fixed(self.auto_fix_btn, "✅ Fixed")
+                    self.fix_applied.emit()
                     
                     # Auto-retry the operation
                     self.retry_operation()
                 else:
-                    QMessageBox.warning(
-                        self,
+                    self.show_message(
+                        QMessageBox.Icon.Warning,
                         "Auto-Fix Failed",
-                        f"❌ {fix_result['message']}\n\nOutput:\n" + "\n".join(fix_result['output'][:10])
+                        f"❌ {fix_result['message']}\n\nOutput:\n{out_preview}"
                     )
             except Exception as e:
-                QMessageBox.critical(
-                    self,
+                self.show_message(
+                    QMessageBox.Icon.Critical,
                     "Auto-Fix Error",
                     f"Error during auto-fix: {str(e)}"
                 )
@@ -869,16 +1127,250 @@ class ErrorFixWidget(QWidget):
     def show_manual_commands(self):
         """Show manual commands for fixing the issue"""
         analysis = self.error_info['analysis']
-        commands_text = "\n".join(analysis['commands'])
+        commands_text = analysis['commands_text']
         
-        QMessageBox.information(
-            self,
+        self.show_message(
+            QMessageBox.Icon.Information,
             "Manual Fix Commands",
             f"To fix this issue manually, run these commands in the repository directory:\n\n{commands_text}\n\n"
             f"Repository path: {self.error_info['repo_path']}"
         )
 
 
+class ErrorModel(QAbstractListModel):
+    """
+    List model holding the error_info dicts shown in the smart fix area
+    """
+
+    ErrorInfoRole = Qt.ItemDataRole.UserRole + 1
+    FixedRole = Qt.ItemDataRole.UserRole + 2  # Set of fixes applied to the row
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._errors: List[Dict] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._errors)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._errors):
+            return None
+
+        error_info = self._errors[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return error_info['repo_display']
+        if role == self.ErrorInfoRole:
+            return error_info
+        if role == self.FixedRole:
+            return error_info.get('fixed', set())
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if role != self.FixedRole or not index.isValid() or index.row() >= len(self._errors):
+            return False
+
+        self._errors[index.row()]['fixed'] = set(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex):
+        # Editable so the delegate can open the button panel for the row
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def add_error(self, error_info: Dict) -> QModelIndex:
+        """Append an error and return its model index"""
+        row = len(self._errors)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._errors.append(error_info)
+        self.endInsertRows()
+        return self.index(row)
+
+    def clear(self):
+        """Remove all errors"""
+        self.beginResetModel()
+        self._errors.clear()
+        self.endResetModel()
+
+    def error_infos(self) -> List[Dict]:
+        """Return the stored error_info dicts in display order"""
+        return list(self._errors)
+
+
+class ErrorDelegate(QStyledItemDelegate):
+    """
+    Paints error rows directly and only creates a real ErrorFixWidget
+    (with its buttons) as the editor of the activated row
+    """
+
+    retry_requested = pyqtSignal(str)  # Forwarded from the active editor
+
+    MARGIN = 8
+    BUTTON_ROW_HEIGHT = 34
+    SIZE_CACHE_LIMIT = 1024
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Editor heights per (description, fix_description) at _cached_width
+        self._editor_heights: Dict[tuple, int] = {}
+        self._cached_width = 0
+
+    def clear_size_cache(self):
+        """Forget computed editor heights"""
+        self._editor_heights.clear()
+
+    def _editor_height(self, error_info: Dict, font: QFont, width: int) -> int:
+        """Return the height of an ErrorFixWidget for this error at the given width.
+        
+        Computed from font metrics and the editor's fixed layout (repository line,
+        wrapped issue and fix labels, button row, separator), so no widgets are built.
+        """
+        analysis = error_info['analysis']
+        fix_text = analysis['fix_description'] if analysis['fix_available'] else None
+        key = (analysis['description'], fix_text)
+
+        # Heights depend on the width, so a resize starts a new cache
+        if width != self._cached_width or len(self._editor_heights) >= self.SIZE_CACHE_LIMIT:
+            self._editor_heights.clear()
+            self._cached_width = width
+
+        if key not in self._editor_heights:
+            left, top, right, bottom = ErrorFixWidget.CONTENTS_MARGINS
+            text_rect = QRect(0, 0, max(1, width - left - right), 0)
+            bold = QFont(font)
+            bold.setBold(True)
+            italic = QFont(font)
+            italic.setItalic(True)
+
+            def wrapped_height(label_font, text):
+                return QFontMetrics(label_font).boundingRect(
+                    text_rect, Qt.TextFlag.TextWordWrap, text
+                ).height()
+
+            heights = [QFontMetrics(bold).height(), wrapped_height(font, f"Issue: {analysis['description']}")]
+            if fix_text is not None:
+                heights.append(wrapped_height(italic, f"💡 Suggested Fix: {fix_text}"))
+            else:
+                heights.append(QFontMetrics(bold).height())
+            heights.append(self._button_height(bold))
+            heights.append(ErrorFixWidget.SEPARATOR_HEIGHT)
+            self._editor_heights[key] = (top + bottom + sum(heights)
+                                         + ErrorFixWidget.SPACING * (len(heights) - 1))
+        return self._editor_heights[key]
+
+    def _button_height(self, font: QFont) -> int:
+        """Return the height of a push button with this font, as QPushButton.sizeHint computes it"""
+        option = QStyleOptionButton()
+        option.fontMetrics = QFontMetrics(font)
+        text_size = option.fontMetrics.size(Qt.TextFlag.TextShowMnemonic, "🔄 Retry Operation")
+        return QApplication.style().sizeFromContents(
+            QStyle.ContentsType.CT_PushButton, option, text_size, None
+        ).height()
+
+    def _text_lines(self, error_info: Dict) -> List[tuple]:
+        """Return (text, color, bold, italic) tuples for a row"""
+        lines = [(f"Repository: {error_info['repo_display']}", "#8B0000", True, False)]
+
+        analysis = error_info['analysis']
+        if analysis['type'] != 'unknown':
+            lines.append((f"Issue: {analysis['description']}", "#000000", False, False))
+            if analysis['fix_available']:
+                lines.append((f"💡 Suggested Fix: {analysis['fix_description']}", "#2E8B57", False, True))
+            else:
+                lines.append(("⚠️ Manual intervention required", "#FF6347", True, False))
+
+        return lines
+
+    def paint(self, painter, option, index):
+        error_info = index.data(ErrorModel.ErrorInfoRole)
+        if error_info is None:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+
+        # Row background
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, QColor("#FFF8DC"))
+        else:
+            painter.fillRect(option.rect, QColor("white"))
+
+        # Labels
+        line_height = option.fontMetrics.height() + 4
+        text_rect = option.rect.adjusted(self.MARGIN, self.MARGIN // 2, -self.MARGIN, 0)
+        for text, color, bold, italic in self._text_lines(error_info):
+            font = QFont(option.font)
+            font.setBold(bold)
+            font.setItalic(italic)
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+
+            text_rect.setHeight(line_height)
+            elided = painter.fontMetrics().elidedText(
+                text, Qt.TextElideMode.ElideRight, text_rect.width()
+            )
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+            text_rect.translate(0, line_height)
+
+        # Hint where the buttons will appear
+        if error_info['analysis']['type'] != 'unknown':
+            painter.setFont(option.font)
+            text_rect.setHeight(self.BUTTON_ROW_HEIGHT)
+            if index.data(ErrorModel.FixedRole):
+                painter.setPen(QColor("#228B22"))
+                hint = "✅ Fixed - click to show fix options"
+            else:
+                painter.setPen(QColor("gray"))
+                hint = "Click to show fix options"
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, hint)
+
+        # Separator
+        painter.setPen(QPen(QColor("#D3D3D3")))
+        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        error_info = index.data(ErrorModel.ErrorInfoRole)
+        if error_info is None:
+            return super().sizeHint(option, index)
+
+        view = option.widget
+        width = view.viewport().width() if view is not None else option.rect.width()
+
+        # Painted row: one elided line per label plus the hint line
+        line_height = option.fontMetrics.height() + 4
+        height = 2 * self.MARGIN + line_height * len(self._text_lines(error_info))
+        if error_info['analysis']['type'] != 'unknown':
+            height += self.BUTTON_ROW_HEIGHT
+            # The row must also fit the editor placed on it by updateEditorGeometry
+            if width > 0:
+                height = max(height, self._editor_height(error_info, option.font, width))
+        return QSize(width, height)
+
+    def createEditor(self, parent, option, index):
+        error_info = index.data(ErrorModel.ErrorInfoRole)
+        if error_info is None or error_info['analysis']['type'] == 'unknown':
+            return None
+
+        editor = ErrorFixWidget(error_info, parent)
+        editor.retry_requested.connect(self.retry_requested)
+        # Store a successful fix right away, not only when the editor closes
+        editor.fix_applied.connect(lambda: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        # The editor is built from error_info, including the applied fixes
+        pass
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.applied_fixes, ErrorModel.FixedRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+
 class GitRepoManager(QMainWindow):
     """
     Main application window for Git Repository Manager
@@ -887,11 +1379,29 @@ class GitRepoManager(QMainWindow):
     def __init__(self):
         super().__init__()
         self.repositories: List[Path] = []
-        self.worker = None
+        self._active_batches = set()  # GitSignals of batches still running
+        self._inflight = 0             # Number of running batches
+        self.health_signals = None
+        self._health_repositories: List[Path] = []  # Repositories of the running health check
+        self._health_results: Dict[Path, tuple] = {}  # repo_path -> (summary_line, is_issue)
+        # repo_path -> (.git/HEAD and .git/index mtimes, timestamp, (summary_line, is_issue))
+        self._health_cache: Dict[Path, tuple] = {}
+        self._operation_repositories: List[Path] = []
+        self._display_names: Dict[Path, str] = {}  # Filled by scan_repositories
+        # Result counters, updated as messages arrive
+        self._success_count = 0
+        self._warning_count = 0
+        self._error_count = 0
         # Config file in same directory as script
         script_dir = Path(__file__).parent
         self.config_file = script_dir / "git_manager_config.json"
-        self.error_widgets = []  # Store error fix widgets
+        self.error_model = ErrorModel()  # Store errors shown in the fix list
+        
+        # One consolidated stylesheet instead of per-widget setStyleSheet calls
+        QApplication.instance().setStyleSheet(APP_QSS)
+        
+        # Size the shared pool once; overlapping batches and health checks all use it
+        QThreadPool.globalInstance().setMaxThreadCount(GIT_POOL_THREADS)
         
         self.init_ui()
         self.load_configuration()
@@ -918,7 +1428,7 @@ class GitRepoManager(QMainWindow):
         config_layout = QHBoxLayout(config_group)
         
         self.config_label = QLabel("No directory configured")
-        self.config_label.setStyleSheet("color: gray;")
+        self.config_label.setObjectName("configLabel")
         config_layout.addWidget(self.config_label)
         
         self.browse_button = QPushButton("Browse Directory")
@@ -946,12 +1456,12 @@ class GitRepoManager(QMainWindow):
         button_layout = QHBoxLayout()
         
         self.pull_button = QPushButton("Pull All Repositories\n(Safe: skips repos with uncommitted changes)")
-        self.pull_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.pull_button.setObjectName("pullBtn")
         self.pull_button.clicked.connect(self.pull_all)
         button_layout.addWidget(self.pull_button)
         
         self.push_button = QPushButton("Push All Repositories\n(Auto: add → commit → push)")
-        self.push_button.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
+        self.push_button.setObjectName("pushBtn")
         self.push_button.clicked.connect(self.push_all)
         button_layout.addWidget(self.push_button)
         
@@ -971,67 +1481,71 @@ class GitRepoManager(QMainWindow):
         
         # Success output (left side)
         success_group = QGroupBox("Successful Operations & Warnings")
-        success_group.setStyleSheet("QGroupBox::title { color: green; font-weight: bold; }")
+        success_group.setObjectName("successGroup")
         success_layout = QVBoxLayout(success_group)
         
-        self.success_text = QTextEdit()
+        self.success_text = QPlainTextEdit()
         self.success_text.setReadOnly(True)
-        self.success_text.setStyleSheet("background-color: #f0f8f0; border: 1px solid #90EE90;")
+        self.success_text.setObjectName("successText")
         success_layout.addWidget(self.success_text)
         
         # Add clear button for success output
         clear_success_btn = QPushButton("Clear Success Log")
-        clear_success_btn.clicked.connect(self.success_text.clear)
-        clear_success_btn.setStyleSheet("background-color: #90EE90; color: #006400;")
+        clear_success_btn.clicked.connect(self.clear_success_area)
+        clear_success_btn.setObjectName("clearSuccessBtn")
         success_layout.addWidget(clear_success_btn)
         
         output_splitter.addWidget(success_group)
         
         # Error output (right side) - Enhanced with fix widgets
         error_group = QGroupBox("Errors & Auto-Fix Solutions")
-        error_group.setStyleSheet("QGroupBox::title { color: red; font-weight: bold; }")
+        error_group.setObjectName("errorGroup")
         error_layout = QVBoxLayout(error_group)
         
         # Error text area (for simple error messages)
-        self.error_text = QTextEdit()
+        self.error_text = QPlainTextEdit()
         self.error_text.setReadOnly(True)
-        self.error_text.setStyleSheet("background-color: #fff5f5; border: 1px solid #FFB6C1; color: #8B0000;")
+        self.error_text.setObjectName("errorText")
         self.error_text.setMaximumHeight(150)
         error_layout.addWidget(self.error_text)
         
         # Smart fix area (for interactive error fixing)
         fix_area_label = QLabel("🔧 Smart Error Analysis & Auto-Fix")
-        fix_area_label.setStyleSheet("font-weight: bold; color: #8B0000; background-color: #FFF8DC; padding: 5px; border: 1px solid #DDD;")
+        fix_area_label.setObjectName("fixAreaLabel")
         error_layout.addWidget(fix_area_label)
         
-        # Scrollable area for fix widgets
-        self.fix_scroll_area = QScrollArea()
-        self.fix_scroll_area.setWidgetResizable(True)
-        self.fix_scroll_area.setStyleSheet("background-color: white; border: 1px solid #DDD;")
-        
-        self.fix_container = QWidget()
-        self.fix_layout = QVBoxLayout(self.fix_container)
-        self.fix_layout.addStretch()  # Push widgets to top
-        
-        self.fix_scroll_area.setWidget(self.fix_container)
-        error_layout.addWidget(self.fix_scroll_area)
+        # Virtualized list for fix entries - only the active row gets real buttons
+        self.fix_list = QListView()
+        self.fix_list.setModel(self.error_model)
+        self.fix_delegate = ErrorDelegate(self.fix_list)
+        self.fix_delegate.retry_requested.connect(self.retry_single_repository)
+        self.fix_list.setItemDelegate(self.fix_delegate)
+        self.fix_list.setEditTriggers(
+            QAbstractItemView.EditTrigger.CurrentChanged | QAbstractItemView.EditTrigger.SelectedClicked
+        )
+        self.fix_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Re-layout on resize, row heights depend on the wrapped editor width
+        self.fix_list.setResizeMode(QListView.ResizeMode.Adjust)
+        self.error_model.modelReset.connect(self.fix_delegate.clear_size_cache)
+        self.fix_list.setObjectName("fixList")
+        error_layout.addWidget(self.fix_list)
         
         # Control buttons for error area
         error_buttons = QHBoxLayout()
         
         clear_error_btn = QPushButton("Clear Error Log")
         clear_error_btn.clicked.connect(self.clear_error_area)
-        clear_error_btn.setStyleSheet("background-color: #FFB6C1; color: #8B0000;")
+        clear_error_btn.setObjectName("clearErrorBtn")
         error_buttons.addWidget(clear_error_btn)
         
-        health_check_btn = QPushButton("🏥 Health Check All")
-        health_check_btn.clicked.connect(self.run_health_check)
-        health_check_btn.setStyleSheet("background-color: #20B2AA; color: white;")
-        error_buttons.addWidget(health_check_btn)
+        self.health_check_button = QPushButton("🏥 Health Check All")
+        self.health_check_button.clicked.connect(self.run_health_check)
+        self.health_check_button.setObjectName("healthCheckBtn")
+        error_buttons.addWidget(self.health_check_button)
         
         retry_failed_btn = QPushButton("🔄 Retry All Failed")
         retry_failed_btn.clicked.connect(self.retry_failed_repositories)
-        retry_failed_btn.setStyleSheet("background-color: #FF8C00; color: white; font-weight: bold;")
+        retry_failed_btn.setObjectName("retryFailedBtn")
         error_buttons.addWidget(retry_failed_btn)
         
         error_buttons.addStretch()
@@ -1197,16 +1711,27 @@ class GitRepoManager(QMainWindow):
             
             self.status_label.setText("Scanning for repositories...")
             
-            # Use rglob to recursively find all .git directories
-            for git_dir in base_path.rglob('.git'):
-                if git_dir.is_dir():
-                    # The parent of .git directory is the repository root
-                    repo_path = git_dir.parent
-                    self.repositories.append(repo_path)
+            # Walk top-down so subtrees can be pruned in place: once a .git
+            # directory is found, don't descend into the repository at all
+            for root, dirs, _ in os.walk(base_dir, topdown=True):
+                if '.git' in dirs:
+                    # The directory containing .git is the repository root
+                    self.repositories.append(Path(root))
+                    dirs[:] = []
+                    continue
+
+                # Skip noisy subtrees that never contain repositories of interest
+                dirs[:] = [d for d in dirs if d not in SCAN_SKIP_DIRS]
             
             # Sort repositories by path for consistent display
             self.repositories.sort(key=lambda x: str(x).lower())
             
+            # Cache display names (show parent context if nested) once per scan
+            self._display_names = {
+                repo: "/".join(repo.parts[-2:]) if len(repo.parts) > 2 else repo.name
+                for repo in self.repositories
+            }
+            
             # Update display
             if self.repositories:
                 # Create relative paths for better display
@@ -1272,16 +1797,60 @@ class GitRepoManager(QMainWindow):
         self.status_label.setStyleSheet("")  # Reset any previous styling
         
         # Clear previous output
-        self.success_text.clear()
+        self.clear_success_area()
         self.clear_error_area()
         
-        # Create and start worker thread
-        self.worker = GitWorker(self.repositories, operation)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.success_output.connect(self.add_success_message)
-        self.worker.error_output.connect(self.add_error_with_fix)
-        self.worker.finished.connect(self.operation_finished)
-        self.worker.start()
+        # Dispatch one task per repository to the thread pool
+        self.start_git_operation(self.repositories, operation)
+    
+    def start_git_operation(self, repositories: List[Path], operation: str):
+        """Run the operation on each repository as a separate thread pool task
+        
+        Batches may overlap (e.g. single-repository retries while another batch
+        runs); operation_finished is only called once none is in flight.
+        """
+        if not repositories:
+            if not self._inflight:
+                self.operation_finished()
+            return
+        
+        # Remember touched repositories so their cached health can be dropped
+        self._operation_repositories.extend(repositories)
+        
+        # Fresh signals per batch so completion counting starts from zero
+        signals = GitSignals(len(repositories))
+        signals.progress.connect(self.update_progress)
+        signals.success_output.connect(self.add_success_message)
+        signals.error_output.connect(self.add_error_with_fix)
+        signals.finished.connect(lambda: self.batch_finished(signals))
+        self._active_batches.add(signals)
+        
+        # Group by remote host; repositories without a known host (or with an
+        # unreadable config) get their own task
+        multiplex_env = GitDiagnostics.network_env()
+        by_host: Dict[str, List[tuple]] = {}
+        for position, repo_path in enumerate(repositories, 1):
+            try:
+                host, ssh_command = GitDiagnostics.remote_config(repo_path)
+                # A repository's own core.sshCommand keeps its identity: no multiplexing
+                network_env = None if ssh_command else multiplex_env
+            except (OSError, subprocess.SubprocessError):
+                host, network_env = '', None
+            display = self._display_names.get(repo_path, repo_path.name)
+            by_host.setdefault(host or str(repo_path), []).append((position, repo_path, display, network_env))
+        
+        pool = QThreadPool.globalInstance()
+        self._inflight += 1
+        for host_repositories in by_host.values():
+            for i in range(min(HOST_TASKS, len(host_repositories))):
+                pool.start(GitRepoRunnable(host_repositories[i::HOST_TASKS], operation, signals))
+    
+    def batch_finished(self, signals: GitSignals):
+        """Handle completion of one batch; finish the operation after the last one"""
+        self._active_batches.discard(signals)
+        self._inflight -= 1
+        if not self._inflight:
+            self.operation_finished()
     
     def update_progress(self, message: str):
         """Update progress display"""
@@ -1289,51 +1858,42 @@ class GitRepoManager(QMainWindow):
     
     def add_success_message(self, message: str):
         """Add message to success output area"""
-        self.success_text.append(message)
+        if message.startswith('✓'):
+            self._success_count += 1
+        if '⚠' in message:
+            self._warning_count += 1
+        
+        self.success_text.appendPlainText(message)
         # Auto-scroll to bottom
         scrollbar = self.success_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
     def add_error_with_fix(self, error_message: str, error_info: Dict):
         """Add error message with auto-fix capabilities"""
+        self._error_count += 1
+        
         # Add basic error to text area
-        self.error_text.append(error_message)
+        self.error_text.appendPlainText(error_message)
         scrollbar = self.error_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         
-        # Add smart fix widget if fix is available
+        # Add smart fix entry if fix is available
         if error_info['analysis']['fix_available'] or error_info['analysis']['type'] != 'unknown':
-            fix_widget = ErrorFixWidget(error_info)
-            
-            # Connect retry signal
-            fix_widget.retry_requested.connect(self.retry_single_repository)
-            
-            # Remove the stretch item temporarily
-            self.fix_layout.removeItem(self.fix_layout.itemAt(self.fix_layout.count() - 1))
-            
-            # Add the fix widget
-            self.fix_layout.addWidget(fix_widget)
-            self.error_widgets.append(fix_widget)
-            
-            # Re-add stretch to keep widgets at top
-            self.fix_layout.addStretch()
+            index = self.error_model.add_error(error_info)
             
-            # Scroll to show new widget
-            # Scroll to show new widget
-            self.fix_scroll_area.ensureWidgetVisible(fix_widget)
+            # Scroll to show new entry
+            self.fix_list.scrollTo(index)
     
     def retry_failed_repositories(self):
         """Retry operation on all repositories that had errors"""
-        if not self.error_widgets:
+        if not self.error_model.rowCount():
             QMessageBox.information(self, "No Failed Repositories", "No repositories with errors to retry.")
             return
         
-        # Extract repository paths from error widgets
-        failed_repos = []
-        for widget in self.error_widgets:
-            repo_path = widget.error_info['repo_path']
-            if repo_path not in failed_repos:
-                failed_repos.append(repo_path)
+        # Extract unique repository paths from error entries, keeping order
+        failed_repos = list(dict.fromkeys(
+            error_info['repo_path'] for error_info in self.error_model.error_infos()
+        ))
         
         if not failed_repos:
             QMessageBox.information(self, "No Failed Repositories", "No repositories with errors to retry.")
@@ -1366,13 +1926,8 @@ class GitRepoManager(QMainWindow):
             self.status_label.setText(f"Retrying {operation} on {len(failed_repos)} repositories...")
             self.status_label.setStyleSheet("color: #FF8C00; font-weight: bold;")
             
-            # Create worker for failed repositories
-            self.worker = GitWorker(failed_repos, operation)
-            self.worker.progress.connect(self.update_progress)
-            self.worker.success_output.connect(self.add_success_message)
-            self.worker.error_output.connect(self.add_error_with_fix)
-            self.worker.finished.connect(self.operation_finished)
-            self.worker.start()
+            # Dispatch tasks for failed repositories
+            self.start_git_operation(failed_repos, operation)
     
     def retry_single_repository(self, repo_path_str: str):
         """Retry operation on a single repository"""
@@ -1395,28 +1950,22 @@ class GitRepoManager(QMainWindow):
         self.status_label.setText(f"Retrying operation on {repo_path.name}...")
         self.status_label.setStyleSheet("color: #FF8C00; font-weight: bold;")
         
-        # Create worker for single repository
-        self.worker = GitWorker([repo_path], operation)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.success_output.connect(self.add_success_message)
-        self.worker.error_output.connect(self.add_error_with_fix)
-        self.worker.finished.connect(self.operation_finished)
-        self.worker.start()
+        # Dispatch task for single repository
+        self.start_git_operation([repo_path], operation)
+    
+    def clear_success_area(self):
+        """Clear all success messages and their counters"""
+        self.success_text.clear()
+        self._success_count = 0
+        self._warning_count = 0
     
     def clear_error_area(self):
-        """Clear all error messages and fix widgets"""
+        """Clear all error messages and fix entries"""
         self.error_text.clear()
+        self._error_count = 0
         
-        # Remove all fix widgets
-        for widget in self.error_widgets:
-            widget.setParent(None)
-        self.error_widgets.clear()
-        
-        # Clear the layout (except stretch)
-        while self.fix_layout.count() > 1:
-            child = self.fix_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
+        # Resetting the model also closes any open fix editor
+        self.error_model.clear()
     
     def run_health_check(self):
         """Run health check on all repositories"""
@@ -1426,24 +1975,62 @@ class GitRepoManager(QMainWindow):
         
         self.status_label.setText("Running health checks...")
         self.status_label.setStyleSheet("color: #20B2AA; font-weight: bold;")
+        self.health_check_button.setEnabled(False)
+        
+        self._health_repositories = list(self.repositories)
+        self._health_results.clear()
+        
+        # Reuse recent results for repositories whose HEAD and index are unchanged
+        now = time.monotonic()
+        to_check = []
+        for repo_path in self._health_repositories:
+            cached = self._health_cache.get(repo_path)
+            if (cached is not None and cached[0] == self.health_cache_key(repo_path)
+                    and now - cached[1] < HEALTH_CACHE_TTL):
+                self._health_results[repo_path] = cached[2]
+            else:
+                to_check.append(repo_path)
+        
+        if not to_check:
+            self.health_check_finished()
+            return
         
+        # Check repositories in parallel; results are collected on the GUI thread
+        self.health_signals = HealthCheckSignals(len(to_check))
+        self.health_signals.result.connect(self.add_health_result)
+        self.health_signals.finished.connect(self.health_check_finished)
+        
+        pool = QThreadPool.globalInstance()
+        for repo_path in to_check:
+            pool.start(HealthCheckTask(repo_path, self._display_names[repo_path], self.health_signals))
+    
+    def health_cache_key(self, repo_path: Path) -> tuple:
+        """Return the .git/HEAD and .git/index mtimes used to validate cached results"""
+        key = []
+        for name in ('HEAD', 'index'):
+            try:
+                key.append(os.stat(repo_path / '.git' / name).st_mtime)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+    
+    def add_health_result(self, repo_path: Path, summary_line: str, is_issue: bool):
+        """Store the health check result of one repository"""
+        result = (summary_line, is_issue)
+        self._health_results[repo_path] = result
+        self._health_cache[repo_path] = (self.health_cache_key(repo_path), time.monotonic(), result)
+    
+    def health_check_finished(self):
+        """Build and show the health report once all checks are done"""
         health_report = []
         issues_found = 0
         
-        for repo_path in self.repositories:
-            repo_display = str(repo_path.name)
-            if len(repo_path.parts) > 2:
-                repo_display = "/".join(repo_path.parts[-2:])
-            
-            health_info = GitDiagnostics.check_repository_health(repo_path)
-            
-            if not health_info['healthy']:
+        # Report in repository order, regardless of completion order
+        for repo_path in self._health_repositories:
+            summary_line, is_issue = self._health_results[repo_path]
+            health_report.append(summary_line)
+            if is_issue:
                 issues_found += 1
-                health_report.append(f"❌ {repo_display}: {', '.join(health_info['issues'])}")
-            elif health_info['warnings']:
-                health_report.append(f"⚠️ {repo_display}: {', '.join(health_info['warnings'])}")
-            else:
-                health_report.append(f"✅ {repo_display}: Healthy")
         
         # Display health report
         if issues_found == 0:
@@ -1453,6 +2040,9 @@ class GitRepoManager(QMainWindow):
             self.status_label.setText(f"⚠️ Health check complete - {issues_found} issues found")
             self.status_label.setStyleSheet("color: orange; font-weight: bold;")
         
+        self.health_check_button.setEnabled(True)
+        self.health_signals = None
+        
         # Show detailed report
         QMessageBox.information(
             self,
@@ -1465,11 +2055,16 @@ class GitRepoManager(QMainWindow):
         # Hide progress bar
         self.progress_bar.setVisible(False)
         
+        # Pull/push may have changed these repositories
+        for repo_path in self._operation_repositories:
+            self._health_cache.pop(repo_path, None)
+        self._operation_repositories = []
+        
         # Update status with summary
-        success_count = self.success_text.toPlainText().count('✓')
-        warning_count = self.success_text.toPlainText().count('⚠')
-        error_count = self.error_text.toPlainText().count('✗')
-        fixable_errors = len(self.error_widgets)
+        success_count = self._success_count
+        warning_count = self._warning_count
+        error_count = self._error_count
+        fixable_errors = self.error_model.rowCount()
         
         if error_count == 0:
             if warning_count > 0:
@@ -1492,9 +2087,6 @@ class GitRepoManager(QMainWindow):
         self.pull_button.setEnabled(True)
         self.push_button.setEnabled(True)
         self.refresh_button.setEnabled(True)
-        
-        # Clean up worker
-        self.worker = None
     
     def show_error(self, error_message: str):
         """Display error message to user"""
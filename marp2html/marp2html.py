@@ -1,14 +1,21 @@
 import sys
 import re
+import html
 import json
 import os
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTextEdit, QPushButton, QLabel, 
                              QSplitter, QMessageBox, QSpinBox, QGroupBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QClipboard
 
 
+# Patterns used while parsing, compiled once at import time
+# Both scan the whole input at once; each match is one (indented) line
+_LIST_RE = re.compile(r'^[^\S\n]*- [^\S\n]*(\S.*?)[^\S\n]*$', re.MULTILINE)
+_IMAGE_RE = re.compile(r'^[^\S\n]*!\[([^\]\n]*)\]\(([^)\n]+)\)', re.MULTILINE)
+
+
 class MarpToHtmlConverter(QMainWindow):
     """
     A PyQt6 application that converts Marp markdown content to HTML format.
@@ -24,9 +31,26 @@ class MarpToHtmlConverter(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        self._initializing = True  # Ignore spinbox signals until init_ui is done
         self.clipboard = QApplication.clipboard()
         self.config_file = "marp_converter_config.json"
+        self._last_saved_pct = None  # Value currently on disk, to skip redundant writes
+        self._last_html = None  # HTML currently shown, to skip redundant document rebuilds
+        self._last_input = None  # Input of the last parse and its result
+        self._last_parsed = None
         self.left_percentage = self.load_config()
+        
+        # Debounce timers: rapid spinbox changes trigger only one conversion / config write
+        self._convert_timer = QTimer(self)
+        self._convert_timer.setSingleShot(True)
+        self._convert_timer.setInterval(150)
+        self._convert_timer.timeout.connect(self.convert_content)
+        
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(1000)
+        self._save_timer.timeout.connect(lambda: self.save_config(self.left_percentage))
+        
         self.init_ui()
         
     def load_config(self):
@@ -37,17 +61,17 @@ class MarpToHtmlConverter(QMainWindow):
             int: The left panel percentage (default: 50)
         """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    percentage = config.get('left_percentage', 50)
-                    # Ensure percentage is within valid range
-                    return max(10, min(90, percentage))
-            else:
-                # Create default config file
-                self.save_config(50)
-                return 50
-        except Exception as e:
+            with open(self.config_file, 'r') as f:
+                percentage = json.load(f).get('left_percentage', 50)
+            self._last_saved_pct = percentage
+            # Ensure percentage is within valid range
+            return max(10, min(90, percentage))
+        except FileNotFoundError:
+            # Create default config file
+            self.save_config(50)
+            return 50
+        except (json.JSONDecodeError, OSError, AttributeError, TypeError) as e:
+            # Unreadable file or unexpected content (e.g. not an object or not a number)
             print(f"Error loading config: {e}")
             return 50
     
@@ -55,13 +79,22 @@ class MarpToHtmlConverter(QMainWindow):
         """
         Save configuration to JSON file.
         
+        The file is written to a temporary path and then renamed over the
+        config file, so a crash never leaves a partially written config.
+        
         Args:
             percentage (int): The left panel percentage to save
         """
+        if percentage == self._last_saved_pct:
+            return
+        
         try:
             config = {'left_percentage': percentage}
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(config))
+            os.replace(tmp_file, self.config_file)
+            self._last_saved_pct = percentage
         except Exception as e:
             print(f"Error saving config: {e}")
         
@@ -70,6 +103,9 @@ class MarpToHtmlConverter(QMainWindow):
         self.setWindowTitle("Marp to HTML Converter")
         self.setGeometry(100, 100, 1200, 700)
         
+        # Shared by the input and output labels (QFont needs the QApplication)
+        self._label_font = QFont("Arial", 12, QFont.Weight.Bold)
+        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -130,7 +166,7 @@ class MarpToHtmlConverter(QMainWindow):
         input_widget = QWidget()
         input_layout = QVBoxLayout(input_widget)
         input_label = QLabel("Input (Marp Markdown):")
-        input_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        input_label.setFont(self._label_font)
         input_layout.addWidget(input_label)
         
         self.input_text = QTextEdit()
@@ -149,7 +185,7 @@ class MarpToHtmlConverter(QMainWindow):
         output_widget = QWidget()
         output_layout = QVBoxLayout(output_widget)
         output_label = QLabel("Output (HTML):")
-        output_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        output_label.setFont(self._label_font)
         output_layout.addWidget(output_label)
         
         self.output_text = QTextEdit()
@@ -167,8 +203,9 @@ class MarpToHtmlConverter(QMainWindow):
         self.status_label = QLabel(f"Ready. Current layout: {self.left_percentage}% / {100-self.left_percentage}%")
         main_layout.addWidget(self.status_label)
         
-        # Convert initial content
+        # Convert initial content - the only conversion during startup
         self.convert_content()
+        self._initializing = False
         
     def update_right_percentage_label(self):
         """Update the label showing the right panel percentage."""
@@ -182,23 +219,30 @@ class MarpToHtmlConverter(QMainWindow):
         Args:
             value (int): New percentage value
         """
+        if self._initializing:
+            return
+        
         self.left_percentage = value
         self.update_right_percentage_label()
-        self.save_config(value)
+        self._save_timer.start()  # Coalesced write of the new value
         
         # Update status
         right_percentage = 100 - value
         self.status_label.setText(f"Layout updated: {value}% / {right_percentage}%. Click 'Convert' to apply changes.")
         
-        # Auto-convert if there's content
-        if self.input_text.toPlainText().strip():
-            self.convert_content()
+        # Auto-convert if there's content, once the value settles
+        input_content = self.input_text.toPlainText()
+        if input_content and not input_content.isspace():
+            self._convert_timer.start()
         
     def read_from_clipboard(self):
         """Read content from the system clipboard."""
         try:
-            clipboard_content = self.clipboard.text()
-            if clipboard_content.strip():
+            # Check for text before materializing it, so image or other
+            # non-text clipboard payloads are never converted to a string
+            mime_data = self.clipboard.mimeData()
+            clipboard_content = mime_data.text() if mime_data is not None and mime_data.hasText() else ''
+            if clipboard_content and not clipboard_content.isspace():
                 self.input_text.setPlainText(clipboard_content)
                 self.status_label.setText("Content loaded from clipboard successfully.")
                 # Auto-convert after loading
@@ -211,14 +255,18 @@ class MarpToHtmlConverter(QMainWindow):
     def convert_content(self):
         """Convert Marp markdown content to HTML format."""
         try:
-            input_content = self.input_text.toPlainText().strip()
-            if not input_content:
+            # No strip() copy needed: the line patterns already skip surrounding whitespace
+            input_content = self.input_text.toPlainText()
+            if not input_content or input_content.isspace():
                 self.status_label.setText("No input content to convert.")
                 return
             
             html_output = self.parse_marp_to_html(input_content)
-            self.output_text.setPlainText(html_output)
-            self.copy_button.setEnabled(True)
+            # setPlainText rebuilds the whole document, so only call it on changes
+            if html_output != self._last_html:
+                self.output_text.setPlainText(html_output)
+                self._last_html = html_output
+                self.copy_button.setEnabled(True)
             
             right_percentage = 100 - self.left_percentage
             self.status_label.setText(f"Content converted successfully! Layout: {self.left_percentage}% / {right_percentage}%")
@@ -237,57 +285,71 @@ class MarpToHtmlConverter(QMainWindow):
         Returns:
             str: The converted HTML content with configurable layout
         """
-        lines = content.split('\n')
-        list_items = []
-        image_info = None
+        # Parsing only depends on the input, so reuse it when only the layout changed
+        if content != self._last_input:
+            self._last_parsed = self._parse(content)
+            self._last_input = content
         
-        # Parse content line by line
-        for line in lines:
-            line = line.strip()
-            
-            # Check for list items (starting with -)
-            if line.startswith('- '):
-                # Remove the '- ' prefix and add to list
-                list_item = line[2:].strip()
-                if list_item:  # Only add non-empty items
-                    list_items.append(list_item)
-            
-            # Check for image markdown pattern: ![w:XXXpt](path)
-            elif line.startswith('!['):
-                image_match = re.match(r'!\[([^\]]*)\]\(([^)]+)\)', line)
-                if image_match:
-                    alt_text = image_match.group(1)
-                    image_path = image_match.group(2)
-                    image_info = {
-                        'alt': alt_text if alt_text else 'Demo image',
-                        'src': image_path
-                    }
-        
-        # Calculate percentages
-        right_percentage = 100 - self.left_percentage
+        return self._render(*self._last_parsed)
+    
+    def _parse(self, content):
+        """
+        Extract list items and the image from the input as ready-made HTML blocks.
         
-        # Generate HTML output with configurable percentages
-        html_parts = []
-        html_parts.append('<div style="display: flex; gap: 0.5em; align-items: stretch;">')
+        Args:
+            content (str): The input Marp markdown content
+            
+        Returns:
+            tuple: (items_block, image_block) HTML strings, empty if absent
+        """
+        # List items: lines starting with '- ' (non-empty items only)
+        list_items = _LIST_RE.findall(content)
         
-        # Left side - List items (configurable percentage)
-        html_parts.append(f'    <div style="flex: 0 0 {self.left_percentage}%;font-size: 1em;">')
+        # Image markdown pattern: ![w:XXXpt](path) - the last one wins
+        image_info = None
+        image_matches = _IMAGE_RE.findall(content)
+        if image_matches:
+            alt_text, image_path = image_matches[-1]
+            image_info = {
+                'alt': alt_text if alt_text else 'Demo image',
+                'src': image_path
+            }
+        
+        # Left side - List items (escaped, since they are user input)
+        items_block = ''
         if list_items:
-            html_parts.append('    <ul>')
-            for item in list_items:
-                html_parts.append(f'      <li>{item}</li>')
-            html_parts.append('    </ul>')
-        html_parts.append('  </div>')
-        
-        # Right side - Image (complementary percentage)
-        html_parts.append(f'  <div style="flex: 0 0 {right_percentage}%;display: flex;justify-content: center; align-items: center;">')
+            items_html = '\n'.join(f'      <li>{html.escape(item, quote=False)}</li>' for item in list_items)
+            items_block = f'\n    <ul>\n{items_html}\n    </ul>'
+        
+        # Right side - Image
+        image_block = ''
         if image_info:
-            html_parts.append(f'    <img src="{image_info["src"]}" alt="{image_info["alt"]}" style="max-width: 100%;">')
-        html_parts.append('  </div>')
+            image_block = (f'\n    <img src="{html.escape(image_info["src"])}" '
+                           f'alt="{html.escape(image_info["alt"])}" style="max-width: 100%;">')
         
-        html_parts.append('</div>')
+        return items_block, image_block
+    
+    def _render(self, items_block, image_block):
+        """
+        Place parsed HTML blocks into the layout using the current percentages.
+        
+        Args:
+            items_block (str): HTML for the list items
+            image_block (str): HTML for the image
+            
+        Returns:
+            str: The complete HTML output
+        """
+        # Calculate percentages
+        right_percentage = 100 - self.left_percentage
         
-        return '\n'.join(html_parts)
+        # Generate HTML output with configurable percentages in a single template
+        return f'''<div style="display: flex; gap: 0.5em; align-items: stretch;">
+    <div style="flex: 0 0 {self.left_percentage}%;font-size: 1em;">{items_block}
+  </div>
+  <div style="flex: 0 0 {right_percentage}%;display: flex;justify-content: center; align-items: center;">{image_block}
+  </div>
+</div>'''
     
     def copy_to_clipboard(self):
         """Copy the converted HTML to the system clipboard."""
@@ -308,6 +370,7 @@ class MarpToHtmlConverter(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event - save current configuration."""
+        self._save_timer.stop()
         self.save_config(self.left_percentage)
         event.accept()
 
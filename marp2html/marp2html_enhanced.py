@@ -1,14 +1,64 @@
 import sys
 import re
+import functools
 import json
 import os
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTextEdit, QPushButton, QLabel, 
                              QSplitter, QMessageBox, QSpinBox, QGroupBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QClipboard
 
 
+@functools.cache
+def _image_re():
+    """Image line pattern, compiled on first use and then reused."""
+    return re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+
+def _escape_html(text):
+    """
+    Escape HTML special characters in code lines and image attributes.
+    
+    Chained replace() calls each run as a fast C substring search, which
+    is several times quicker than a per-character translate() table.
+    """
+    return (text.replace('&', '&amp;')
+                .replace('<', '&lt;')
+                .replace('>', '&gt;')
+                .replace('"', '&quot;'))
+
+
+# Static HTML fragments, built once instead of on every conversion
+_WRAPPER_OPEN = '<div style="display: flex; gap: 0.5em; align-items: stretch;">'
+_PRE_OPEN = '    <pre style="background-color: #f4f4f4; padding: 1em; border-radius: 5px; overflow-x: auto; margin: 0.5em 0;">'
+_CODE_STYLE = 'style="font-family: \'Courier New\', monospace; font-size: 0.9em; line-height: 1.4;"'
+_CODE_OPEN = f'      <code {_CODE_STYLE}>'
+_CODE_CLOSE = ('      </code>', '    </pre>')
+_UL_OPEN = '    <ul style="margin: 0.5em 0;">'
+_UL_CLOSE = '    </ul>'
+_NO_TEXT_CONTENT = '    <p style="color: #666; font-style: italic;">No lists or code blocks detected in the input.</p>'
+_IMG_STYLE = 'style="max-width: 100%; height: auto; border-radius: 5px;"'
+_NO_IMAGES = '    <div style="color: #ccc; font-style: italic; text-align: center;">No images detected</div>'
+_DIV_CLOSE = '  </div>'
+_LEFT_DIV_TMPL = '  <div style="flex: 0 0 %d%%; font-size: 1em;">'
+_RIGHT_DIV_TMPL = '  <div style="flex: 0 0 %d%%; display: flex; justify-content: center; align-items: center; flex-direction: column; gap: 1em;">'
+_WRAPPER_CLOSE = ('  </div>', '</div>')
+
+# Sample input for testing - both lists and code
+_SAMPLE_CONTENT = """```python
+names = ["Vera", "Chuck", "Samantha", 
+         "Roberto", "Joe", "Dave", "Tina"]
+salaries = [2000, 1800, 1800, 2100, 
+            2000, 2200, 2300]
+
+for n in names: print(n)
+for s in salaries: print(s)
+```
+
+![w:320pt](./pic/proto/v1.webp)"""
+
+
 class MarpToHtmlConverter(QMainWindow):
     """
     A PyQt6 application that converts Marp markdown content to HTML format.
@@ -27,7 +77,23 @@ class MarpToHtmlConverter(QMainWindow):
         super().__init__()
         self.clipboard = QApplication.clipboard()
         self.config_file = "marp_converter_config.json"
+        self._last_saved_pct = None  # Value currently on disk, to skip redundant writes
+        self._parse_cache = (None, None)  # (input_text, parsed panels)
+        self._last_converted_input = None  # Input and layout currently shown as HTML
+        self._last_left_pct = None
         self.left_percentage = self.load_config()
+        
+        # Debounce timers: rapid spinbox changes trigger only one conversion / config write
+        self._convert_timer = QTimer(self)
+        self._convert_timer.setSingleShot(True)
+        self._convert_timer.setInterval(150)
+        self._convert_timer.timeout.connect(self.convert_content)
+        
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(lambda: self.save_config(self.left_percentage))
+        
         self.init_ui()
         
     def load_config(self):
@@ -42,6 +108,7 @@ class MarpToHtmlConverter(QMainWindow):
                 with open(self.config_file, 'r') as f:
                     config = json.load(f)
                     percentage = config.get('left_percentage', 50)
+                    self._last_saved_pct = percentage
                     # Ensure percentage is within valid range
                     return max(10, min(90, percentage))
             else:
@@ -56,13 +123,22 @@ class MarpToHtmlConverter(QMainWindow):
         """
         Save configuration to JSON file.
         
+        The file is written to a temporary path and then renamed over the
+        config file, so a crash never leaves a partially written config.
+        
         Args:
             percentage (int): The left panel percentage to save
         """
+        if percentage == self._last_saved_pct:
+            return
+        
         try:
             config = {'left_percentage': percentage}
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(config))
+            os.replace(tmp_file, self.config_file)
+            self._last_saved_pct = percentage
         except Exception as e:
             print(f"Error saving config: {e}")
         
@@ -95,6 +171,8 @@ class MarpToHtmlConverter(QMainWindow):
         self.percentage_spinbox.setRange(10, 90)  # Reasonable range
         self.percentage_spinbox.setValue(self.left_percentage)
         self.percentage_spinbox.setSuffix("%")
+        # Typing "75" changes the value once on Enter/focus loss, not per keystroke
+        self.percentage_spinbox.setKeyboardTracking(False)
         self.percentage_spinbox.valueChanged.connect(self.on_percentage_changed)
         config_layout.addWidget(self.percentage_spinbox)
         
@@ -136,19 +214,12 @@ class MarpToHtmlConverter(QMainWindow):
         
         self.input_text = QTextEdit()
         self.input_text.setPlaceholderText("Paste your Marp content here or click 'Read from Clipboard'")
-        # Add sample content for testing - both lists and code
-        sample_content = """```python
-names = ["Vera", "Chuck", "Samantha", 
-         "Roberto", "Joe", "Dave", "Tina"]
-salaries = [2000, 1800, 1800, 2100, 
-            2000, 2200, 2300]
-
-for n in names: print(n)
-for s in salaries: print(s)
-```
-
-![w:320pt](./pic/proto/v1.webp)"""
-        self.input_text.setPlainText(sample_content)
+        # Sample content for testing is only shown when there is nothing to paste
+        # isspace() checks in place, without a stripped copy of the clipboard
+        clipboard_text = self.clipboard.text()
+        show_sample = not clipboard_text or clipboard_text.isspace()
+        if show_sample:
+            self.input_text.setPlainText(_SAMPLE_CONTENT)
         input_layout.addWidget(self.input_text)
         
         # Output panel
@@ -173,8 +244,9 @@ for s in salaries: print(s)
         self.status_label = QLabel(f"Ready. Current layout: {self.left_percentage}% / {100-self.left_percentage}%")
         main_layout.addWidget(self.status_label)
         
-        # Convert initial content
-        self.convert_content()
+        # Convert initial content once the window has been shown
+        if show_sample:
+            QTimer.singleShot(0, self.convert_content)
         
     def update_right_percentage_label(self):
         """Update the label showing the right panel percentage."""
@@ -190,15 +262,19 @@ for s in salaries: print(s)
         """
         self.left_percentage = value
         self.update_right_percentage_label()
-        self.save_config(value)
+        self._save_timer.start()  # Written once the spinbox settles
         
         # Update status
         right_percentage = 100 - value
         self.status_label.setText(f"Layout updated: {value}% / {right_percentage}%. Click 'Convert' to apply changes.")
         
-        # Auto-convert if there's content
-        if self.input_text.toPlainText().strip():
-            self.convert_content()
+        # Auto-convert if there's content not already shown with this layout
+        input_content = self.input_text.toPlainText().strip()
+        if input_content and (input_content != self._last_converted_input
+                              or value != self._last_left_pct):
+            self._convert_timer.start()  # Converted once the spinbox settles
+        else:
+            self._convert_timer.stop()
         
     def read_from_clipboard(self):
         """Read content from the system clipboard."""
@@ -223,8 +299,19 @@ for s in salaries: print(s)
                 return
             
             html_output = self.parse_marp_to_html(input_content)
-            self.output_text.setPlainText(html_output)
+            # Replace the document in one go: no repaints or change signals
+            # while Qt rebuilds it, a single relayout when updates resume
+            document = self.output_text.document()
+            self.output_text.setUpdatesEnabled(False)
+            document.blockSignals(True)
+            try:
+                self.output_text.setPlainText(html_output)
+            finally:
+                document.blockSignals(False)
+                self.output_text.setUpdatesEnabled(True)
             self.copy_button.setEnabled(True)
+            self._last_converted_input = input_content
+            self._last_left_pct = self.left_percentage
             
             right_percentage = 100 - self.left_percentage
             self.status_label.setText(f"Content converted successfully! Layout: {self.left_percentage}% / {right_percentage}%")
@@ -232,160 +319,134 @@ for s in salaries: print(s)
         except Exception as e:
             self.show_error(f"Error during conversion: {str(e)}")
     
-    def detect_content_type(self, content):
+    def parse_marp_to_html(self, content):
+        """
+        Parse Marp markdown content and convert to HTML format.
+        Now handles both code blocks and lists with configurable layout.
+        
+        Args:
+            content (str): The input Marp markdown content
+            
+        Returns:
+            str: The converted HTML content with configurable layout
+        """
+        # Parsing only depends on the input, so a layout change just re-templates
+        if content != self._parse_cache[0]:
+            self._parse_cache = (content, self._parse(content))
+        
+        return self._render(*self._parse_cache[1])
+    
+    def _parse(self, content):
         """
-        Analyze the content to determine what type it contains.
+        Walk the input lines once and build the HTML for both sides of the layout.
         
         This method demonstrates:
         - String parsing and pattern recognition
         - State machine logic (tracking code block state)
-        - Regular expressions for pattern matching
-        - Data structure organization
+        - Single-pass HTML generation while walking the lines
+        - Security considerations (HTML escaping)
         
         Args:
-            content (str): The input content to analyze
+            content (str): The input Marp markdown content
             
         Returns:
-            dict: Information about detected content types
+            tuple: (left_block, right_block) HTML strings for the two panels
         """
-        lines = content.split('\n')
-        
-        # Initialize detection results
-        result = {
-            'has_code_block': False,
-            'has_list': False,
-            'has_image': False,
-            'code_blocks': [],
-            'list_items': [],
-            'images': []
-        }
+        # HTML is streamed into these while walking the lines once:
+        # code blocks and the list go to the left side, images to the right
+        left_parts = []
+        list_parts = []
+        right_parts = []
+        had_code = False
+        had_list = False
         
         # State tracking for code blocks (finite state machine concept)
-        in_code_block = False
-        current_code_block = {'language': '', 'lines': []}
+        # Code is written straight into left_parts; this is where the open
+        # block starts, None outside one, so an unclosed block can be dropped
+        code_start = None
         
-        for line in lines:
+        for line in content.split('\n'):
             line_stripped = line.strip()
+            # Dispatch on the first character; most lines then cost a single
+            # comparison instead of a chain of startswith() calls
+            c = line_stripped[:1]
             
             # Check for code block start/end (``` markers)
-            if line_stripped.startswith('```'):
-                if not in_code_block:
-                    # Starting a code block
-                    in_code_block = True
-                    result['has_code_block'] = True
-                    # Extract language (everything after ```)
+            if c == '`' and line_stripped.startswith('```'):
+                if code_start is None:
+                    # Starting a code block - language is everything after ```
+                    had_code = True
+                    code_start = len(left_parts)
                     language = line_stripped[3:].strip()
-                    current_code_block = {'language': language, 'lines': []}
+                    if language:
+                        left_parts.extend((_PRE_OPEN, f'      <code class="language-{language}" {_CODE_STYLE}>'))
+                    else:
+                        left_parts.extend((_PRE_OPEN, _CODE_OPEN))
                 else:
                     # Ending a code block
-                    in_code_block = False
-                    result['code_blocks'].append(current_code_block.copy())
-                    current_code_block = {'language': '', 'lines': []}
-            elif in_code_block:
-                # Inside a code block - collect the line (preserve original formatting)
-                current_code_block['lines'].append(line)
-            elif line_stripped.startswith('- '):
+                    left_parts.extend(_CODE_CLOSE)
+                    code_start = None
+            elif code_start is not None:
+                # Inside a code block - keep original formatting
+                # IMPORTANT: Escape HTML characters to prevent XSS and display issues
+                left_parts.append(_escape_html(line))
+            elif c == '-' and line_stripped.startswith('- '):
                 # List item detected
-                result['has_list'] = True
+                had_list = True
                 list_item = line_stripped[2:].strip()
                 if list_item:
-                    result['list_items'].append(list_item)
-            elif line_stripped.startswith('!['):
-                # Image detected using regex
-                image_match = re.match(r'!\[([^\]]*)\]\(([^)]+)\)', line_stripped)
+                    list_parts.append(f'      <li>{list_item}</li>')
+            elif c == '!':
+                # Possible image, the regex checks for the full ![alt](src) form
+                image_match = _image_re().match(line_stripped)
                 if image_match:
-                    result['has_image'] = True
-                    alt_text = image_match.group(1)
-                    image_path = image_match.group(2)
-                    result['images'].append({
-                        'alt': alt_text if alt_text else 'Demo image',
-                        'src': image_path
-                    })
-        
-        return result
+                    # Escaped here once; the cached tag is reused by every re-render
+                    alt_text = _escape_html(image_match.group(1) or 'Demo image')
+                    image_path = _escape_html(image_match.group(2))
+                    right_parts.append(f'    <img src="{image_path}" alt="{alt_text}" {_IMG_STYLE}>')
+        
+        # Only complete code blocks are shown
+        if code_start is not None:
+            del left_parts[code_start:]
+        
+        # Left side - Main content (code blocks, then lists)
+        if had_list:
+            left_parts.append(_UL_OPEN)
+            left_parts.extend(list_parts)
+            left_parts.append(_UL_CLOSE)
+        
+        # If no content detected, show a helpful message
+        if not had_code and not had_list:
+            left_parts.append(_NO_TEXT_CONTENT)
+        
+        # Right side - Images
+        return '\n'.join(left_parts), '\n'.join(right_parts or (_NO_IMAGES,))
     
-    def parse_marp_to_html(self, content):
+    def _render(self, left_block, right_block):
         """
-        Parse Marp markdown content and convert to HTML format.
-        Now handles both code blocks and lists with configurable layout.
-        
-        This method demonstrates:
-        - Content analysis and classification
-        - Dynamic HTML generation
-        - CSS styling in Python strings
-        - Security considerations (HTML escaping)
-        - Flexible layout systems
+        Place the parsed panels into the layout using the current percentages.
         
         Args:
-            content (str): The input Marp markdown content
+            left_block (str): HTML for the left panel (code blocks and lists)
+            right_block (str): HTML for the right panel (images)
             
         Returns:
-            str: The converted HTML content with configurable layout
+            str: The complete HTML output
         """
-        # Analyze the content first
-        content_info = self.detect_content_type(content)
-        
         # Calculate percentages for flexible layout
-        right_percentage = 100 - self.left_percentage
-        
-        # Generate HTML output with configurable percentages
-        html_parts = []
-        html_parts.append('<div style="display: flex; gap: 0.5em; align-items: stretch;">')
-        
-        # Left side - Main content (lists or code blocks)
-        html_parts.append(f'  <div style="flex: 0 0 {self.left_percentage}%; font-size: 1em;">')
-        
-        # Add code blocks if present
-        if content_info['has_code_block']:
-            for code_block in content_info['code_blocks']:
-                language = code_block['language']
-                code_lines = code_block['lines']
-                
-                # Create syntax-highlighted code block with proper styling
-                html_parts.append('    <pre style="background-color: #f4f4f4; padding: 1em; border-radius: 5px; overflow-x: auto; margin: 0.5em 0;">')
-                if language:
-                    html_parts.append(f'      <code class="language-{language}" style="font-family: \'Courier New\', monospace; font-size: 0.9em; line-height: 1.4;">')
-                else:
-                    html_parts.append('      <code style="font-family: \'Courier New\', monospace; font-size: 0.9em; line-height: 1.4;">')
-                
-                # Add each line of code with proper HTML escaping
-                for code_line in code_lines:
-                    # IMPORTANT: Escape HTML characters to prevent XSS and display issues
-                    escaped_line = (code_line.replace('&', '&amp;')
-                                               .replace('<', '&lt;')
-                                               .replace('>', '&gt;')
-                                               .replace('"', '&quot;'))
-                    html_parts.append(escaped_line)
-                
-                html_parts.append('      </code>')
-                html_parts.append('    </pre>')
-        
-        # Add lists if present
-        if content_info['has_list']:
-            html_parts.append('    <ul style="margin: 0.5em 0;">')
-            for item in content_info['list_items']:
-                html_parts.append(f'      <li>{item}</li>')
-            html_parts.append('    </ul>')
-        
-        # If no content detected, show a helpful message
-        if not content_info['has_code_block'] and not content_info['has_list']:
-            html_parts.append('    <p style="color: #666; font-style: italic;">No lists or code blocks detected in the input.</p>')
-        
-        html_parts.append('  </div>')
-        
-        # Right side - Images (complementary percentage)
-        html_parts.append(f'  <div style="flex: 0 0 {right_percentage}%; display: flex; justify-content: center; align-items: center; flex-direction: column; gap: 1em;">')
-        
-        if content_info['has_image']:
-            for image in content_info['images']:
-                html_parts.append(f'    <img src="{image["src"]}" alt="{image["alt"]}" style="max-width: 100%; height: auto; border-radius: 5px;">')
-        else:
-            html_parts.append('    <div style="color: #ccc; font-style: italic; text-align: center;">No images detected</div>')
-        
-        html_parts.append('  </div>')
-        html_parts.append('</div>')
-        
-        return '\n'.join(html_parts)
+        left_percentage = self.left_percentage
+        right_percentage = 100 - left_percentage
+        
+        # An empty panel body (e.g. only an unterminated code block) adds no line
+        return '\n'.join(filter(None, (
+            _WRAPPER_OPEN,
+            _LEFT_DIV_TMPL % left_percentage,
+            left_block,
+            _DIV_CLOSE,
+            _RIGHT_DIV_TMPL % right_percentage,
+            right_block,
+            *_WRAPPER_CLOSE
+        )))
     
     def copy_to_clipboard(self):
         """Copy the converted HTML to the system clipboard."""
@@ -406,6 +467,7 @@ for s in salaries: print(s)
     
     def closeEvent(self, event):
         """Handle application close event - save current configuration."""
+        self._save_timer.stop()
         self.save_config(self.left_percentage)
         event.accept()
 
@@ -0,0 +1,33 @@
+"""
+Regression tests for the patterns used by marp2html.py.
+
+The reference is the original line-by-line parser the patterns replaced.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from marp2html import _LIST_RE
+
+
+def original_list_items(content):
+    """List items as found by the original per-line parser"""
+    items = []
+    for line in content.split('\n'):
+        line = line.strip()
+        if line.startswith('- '):
+            item = line[2:].strip()
+            if item:
+                items.append(item)
+    return items
+
+
+@pytest.mark.parametrize("content", [
+    "- plain\n  - indented\n\t- tabbed",
+    "\xa0- nbsp indent\n　- ideographic space",
+    "\v- vertical tab\n\f- form feed",
+    "- trailing spaces \xa0\r\n-  spaced\n- \n-no space\ntext - not an item",
+])
+def test_list_items_match_original_parser(content):
+    assert _LIST_RE.findall(content) == original_list_items(content)
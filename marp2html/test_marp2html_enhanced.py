@@ -0,0 +1,62 @@
+"""
+Regression tests for the HTML layout produced by marp2html_enhanced.py.
+
+Expected outputs are those of the original single-pass renderer.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from marp2html_enhanced import MarpToHtmlConverter
+
+NO_IMAGES_PANEL = (
+    '  <div style="flex: 0 0 50%; display: flex; justify-content: center; '
+    'align-items: center; flex-direction: column; gap: 1em;">\n'
+    '    <div style="color: #ccc; font-style: italic; text-align: center;">No images detected</div>\n'
+    '  </div>\n'
+    '</div>'
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def converter(qapp, tmp_path, monkeypatch):
+    # The converter reads and writes its config file in the working directory
+    monkeypatch.chdir(tmp_path)
+    window = MarpToHtmlConverter()
+    window.left_percentage = 50
+    yield window
+    window.close()
+
+
+def test_unclosed_fence_only_leaves_left_panel_empty(converter):
+    expected = (
+        '<div style="display: flex; gap: 0.5em; align-items: stretch;">\n'
+        '  <div style="flex: 0 0 50%; font-size: 1em;">\n'
+        '  </div>\n'
+        + NO_IMAGES_PANEL
+    )
+    assert converter.parse_marp_to_html("```python\nx = 1") == expected
+
+
+def test_unclosed_fence_after_list_is_dropped(converter):
+    expected = (
+        '<div style="display: flex; gap: 0.5em; align-items: stretch;">\n'
+        '  <div style="flex: 0 0 50%; font-size: 1em;">\n'
+        '    <ul style="margin: 0.5em 0;">\n'
+        '      <li>a</li>\n'
+        '    </ul>\n'
+        '  </div>\n'
+        + NO_IMAGES_PANEL
+    )
+    assert converter.parse_marp_to_html("- a\n```\nopen") == expected
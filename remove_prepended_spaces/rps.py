@@ -17,6 +17,8 @@ File: nkuase/coursetools/remove_prepended_spaces/rps2.py
 """
 
 import sys
+import re
+import functools
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                              QHBoxLayout, QWidget, QTextEdit, QPushButton, 
                              QLabel, QMessageBox, QSplitter)
@@ -24,6 +26,24 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
 
+@functools.cache
+def _lead_spaces_re():
+    """Leading spaces of a line, counted without building a stripped copy."""
+    return re.compile(r' *')
+
+
+@functools.cache
+def _first_indent_re():
+    """Leading spaces of the first line that has non-whitespace content."""
+    return re.compile(r'^( *)(?=[^\n]*\S)', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=32)
+def _indent_re(spaces):
+    """Pattern matching up to `spaces` leading spaces on lines that have content."""
+    return re.compile(rf'^ {{1,{spaces}}}(?=[^\n]*\S)', re.MULTILINE)
+
+
 class RemovePrependedSpacesApp(QMainWindow):
     """Remove Prepended Spaces application with verification and auto-copy."""
     
@@ -128,77 +148,48 @@ class RemovePrependedSpacesApp(QMainWindow):
     
     def has_prepended_spaces(self, text):
         """Check if line 1 has prepended spaces that can be removed."""
-        if not text.strip():
-            return False, 0
-            
-        lines = text.split('\n')
+        # Peek at the first line instead of splitting the whole text
+        newline = text.find('\n')
+        first_line = text if newline < 0 else text[:newline]
         
-        # Check first line for leading spaces
-        if not lines or not lines[0].strip():
+        if first_line.strip():
+            # Count leading spaces in first line
+            leading_spaces = _lead_spaces_re().match(first_line).end()
+        else:
             # First line is empty, check for first non-empty line
-            for i, line in enumerate(lines):
-                if line.strip():
-                    leading_spaces = len(line) - len(line.lstrip(' '))
-                    return leading_spaces > 0, leading_spaces
-            return False, 0
-        
-        # Count leading spaces in first line
-        first_line = lines[0]
-        leading_spaces = len(first_line) - len(first_line.lstrip(' '))
+            match = _first_indent_re().search(text)
+            leading_spaces = len(match.group(1)) if match else 0
         
         return leading_spaces > 0, leading_spaces
     
     def remove_prepended_spaces(self, text):
-        """Remove prepended spaces based on first line's leading spaces.
+        """Remove prepended spaces based on first line's leading spaces."""
+        return self._strip_leading(text)[1]
+    
+    def _strip_leading(self, text):
+        """Count and remove prepended spaces in one pass, returning (N, processed text).
         
         Algorithm:
         1. Count leading spaces in line 1 (N)
         2. Remove N spaces from all lines
         3. If a line has fewer than N spaces, remove as many as possible
         """
-        if not text.strip():
-            return text
-            
-        lines = text.split('\n')
-        
-        if not lines:
-            return text
-        
-        # Find the first non-empty line to determine N
-        spaces_to_remove = 0
-        first_non_empty_idx = -1
-        
-        for i, line in enumerate(lines):
-            if line.strip():  # Found first non-empty line
-                spaces_to_remove = len(line) - len(line.lstrip(' '))
-                first_non_empty_idx = i
-                break
+        # Find the first non-empty line to determine N, without splitting the text
+        match = _first_indent_re().search(text)
+        spaces_to_remove = len(match.group(1)) if match else 0
         
         # If no non-empty lines found or no leading spaces
-        if first_non_empty_idx == -1 or spaces_to_remove == 0:
-            return text
+        if spaces_to_remove == 0:
+            return 0, text
             
-        # Remove N spaces from all lines (or as many as possible)
-        processed_lines = []
-        for line in lines:
-            if line.strip():  # Non-empty line
-                # Count current leading spaces
-                current_spaces = len(line) - len(line.lstrip(' '))
-                # Remove min(N, current_spaces) spaces
-                spaces_to_actually_remove = min(spaces_to_remove, current_spaces)
-                processed_line = line[spaces_to_actually_remove:]
-                processed_lines.append(processed_line)
-            else:  # Empty line - keep as is
-                processed_lines.append(line)
-                
-        return '\n'.join(processed_lines)
+        # Remove N spaces from all lines (or as many as possible) in one
+        # substitution; empty and whitespace-only lines are kept as is
+        return spaces_to_remove, _indent_re(spaces_to_remove).sub('', text)
     
-    def verify_processing(self, original, processed):
+    def verify_processing(self, original, processed, orig_spaces):
         """Verify that prepended spaces were removed based on first line."""
-        # Check original first line had prepended spaces
-        orig_has_spaces, orig_spaces = self.has_prepended_spaces(original)
-        
-        if not orig_has_spaces:
+        # Check original first line had prepended spaces (counted while processing)
+        if not orig_spaces:
             return False, "First line had no prepended spaces to remove"
             
         if original == processed:
@@ -224,9 +215,10 @@ class RemovePrependedSpacesApp(QMainWindow):
                 return
             
             # Requirement 6: Check if prepended spaces exist
-            has_spaces, min_spaces = self.has_prepended_spaces(input_text)
+            # (counted in the same pass that processes the text)
+            min_spaces, processed_text = self._strip_leading(input_text)
             
-            if not has_spaces:
+            if not min_spaces:
                 QMessageBox.information(
                     self, 
                     "No Work Needed", 
@@ -235,14 +227,11 @@ class RemovePrependedSpacesApp(QMainWindow):
                 self.statusBar().showMessage("ℹ️ No prepended spaces found - no work needed")
                 return
             
-            # Process the text
-            processed_text = self.remove_prepended_spaces(input_text)
-            
             # Show in output area
             self.output_text.setPlainText(processed_text)
             
             # Requirement 7: Verify the processing worked
-            success, message = self.verify_processing(input_text, processed_text)
+            success, message = self.verify_processing(input_text, processed_text, min_spaces)
             
             if not success:
                 QMessageBox.warning(self, "Processing Issue", f"Verification failed:\n{message}")